@@ -26,11 +26,12 @@ class Command(BaseCommand):
         response = schema_view.without_ui(cache_timeout=0)(django_request)
         response.render()
 
-        openapi_schema = json.loads(response.content.decode())
+        openapi_schema = json.loads(response.content)
 
         output_dir = "interfaces"
         os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, "openapi.json")
 
+        payload = json.dumps(openapi_schema, indent=2)
         with open(output_path, "w") as f:
-            json.dump(openapi_schema, f, indent=2)
+            f.write(payload)